@@ -1,8 +1,13 @@
 import streamlit as st
 import extract_profile
-import time
+import os
+import hashlib
+from datetime import datetime
 from pathlib import Path
 
+# Progress is shown in the UI, so keep the extractor's console output quiet
+extract_profile.QUIET = True
+
 # --- PAGE CONFIGURATION ---
 st.set_page_config(
     page_title="SkyBlock Profile Extractor",
@@ -11,6 +16,27 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# --- CACHED LOOKUPS ---
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_get_uuid(username):
+    """Mojang lookup, cached per username (no API key involved)."""
+    return extract_profile.get_player_uuid(username)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_get_profiles(uuid, key_hash, _api_key):
+    """Profile list for a UUID, cached per API key via its hash so the raw key is never stored.
+
+    Only the summary is kept; the full profile data is fetched fresh by fetch_profile_data when extracting.
+    """
+    return [{k: v for k, v in p.items() if k != 'data'} for p in extract_profile.get_profiles(uuid, _api_key)]
+
+def fetch_profile_data(uuid, profile_id, api_key):
+    """Current version of one profile, with its full data, for extraction."""
+    for p in extract_profile.get_profiles(uuid, api_key):
+        if p['id'] == profile_id:
+            return p
+    raise Exception("Profile no longer exists")
+
 # --- CUSTOM CSS STYLING ---
 st.markdown("""
 <style>
@@ -138,13 +164,17 @@ with st.sidebar:
     except:
         pass
 
-    api_key_input = st.text_input("Hypixel API Key", value=default_key, type="password", help="Get this from developer.hypixel.net")
+    # A form only submits on the button, so the key file isn't rewritten on every edit
+    with st.form("api_key_form"):
+        api_key_input = st.text_input("Hypixel API Key", value=default_key, type="password", help="Get this from developer.hypixel.net")
+        save_key = st.form_submit_button("💾 Save Key", use_container_width=True)
     
-    if api_key_input and api_key_input != default_key:
+    if save_key and api_key_input and not extract_profile.is_valid_api_key(api_key_input):
+        st.error("That doesn't look like a Hypixel API key (expected xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx).")
+    elif save_key and api_key_input and api_key_input != default_key:
         # Save new key
         try:
-            with open("api_key.txt", "w") as f:
-                f.write(api_key_input)
+            Path("api_key.txt").write_text(api_key_input)
             st.toast("API Key saved!", icon="💾")
         except Exception as e:
             st.error(f"Could not save API key: {e}")
@@ -179,22 +209,32 @@ with st.container():
 # --- SESSION STATE MANAGEMENT ---
 if "profiles" not in st.session_state:
     st.session_state.profiles = None
+if "profile_options" not in st.session_state:
+    st.session_state.profile_options = None
 if "uuid" not in st.session_state:
     st.session_state.uuid = None
 if "real_username" not in st.session_state:
     st.session_state.real_username = None
 
 # --- LOGIC: FETCH PROFILES ---
-if fetch_btn and username and api_key_input:
+if fetch_btn and username and api_key_input and not extract_profile.is_valid_api_key(api_key_input):
+    st.warning("That doesn't look like a Hypixel API key (expected xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx).")
+
+elif fetch_btn and username and api_key_input:
     with st.spinner("Talking to Mojang & Hypixel..."):
         try:
             # Get UUID
-            uuid_fmt, uuid_raw = extract_profile.get_player_uuid(username)
+            uuid_fmt, uuid_raw = cached_get_uuid(username)
             st.session_state.uuid = uuid_fmt
             
             # Get Profiles
-            profiles = extract_profile.get_profiles(uuid_fmt, api_key_input)
+            profiles = cached_get_profiles(uuid_fmt, hashlib.sha256(api_key_input.encode()).hexdigest(), api_key_input)
             st.session_state.profiles = profiles
+            # Build the radio labels once here instead of on every rerun
+            st.session_state.profile_options = {
+                f"{p['name']} ({p['game_mode']}) - Last Save: {datetime.fromtimestamp(p['last_save']/1000).isoformat(' ', 'seconds')}": p
+                for p in profiles
+            }
             st.session_state.real_username = username # Could extract real name from API if function returned it
             
             st.success(f"Found {len(profiles)} profiles for {username}!")
@@ -202,6 +242,7 @@ if fetch_btn and username and api_key_input:
         except Exception as e:
             st.error(f"Error: {str(e)}")
             st.session_state.profiles = None
+            st.session_state.profile_options = None
 
 elif fetch_btn and not api_key_input:
     st.warning("Please enter your Hypixel API Key in the sidebar.")
@@ -211,11 +252,7 @@ if st.session_state.profiles:
     st.divider()
     st.subheader("Select Profile")
     
-    # Create friendly labels for the radio button
-    profile_options = {
-        f"{p['name']} ({p['game_mode']}) - Last Save: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(p['last_save']/1000))}": p 
-        for p in st.session_state.profiles
-    }
+    profile_options = st.session_state.profile_options
     
     selected_label = st.radio(
         "Choose a profile to download:", 
@@ -242,9 +279,9 @@ if st.session_state.profiles:
                     # Note: We need to handle the prints inside extract_main or just let it run.
                     # Since we imported extract_profile, we can call extract_data directly.
                     
-                    out_dir, count = extract_profile.extract_data(
+                    out_dir, count, warnings = extract_profile.extract_data(
                         st.session_state.uuid, 
-                        selected_profile, 
+                        fetch_profile_data(st.session_state.uuid, selected_profile['id'], api_key_input), 
                         api_key_input, 
                         st.session_state.real_username or username
                     )
@@ -261,9 +298,13 @@ if st.session_state.profiles:
                     </div>
                     """, unsafe_allow_html=True)
                     
+                    for warning in warnings:
+                        st.warning(warning)
+                    
                     with st.expander("📂 View Extracted Files"):
                         # List files in the output directory
-                        files = sorted([f.name for f in out_dir.iterdir() if f.is_file()])
+                        with os.scandir(out_dir) as entries:
+                            files = sorted(e.name for e in entries if e.is_file())
                         for f in files:
                             st.code(f, language="text")
 
@@ -14,7 +14,13 @@ param(
     [Parameter(Position = 1)]
     [string]$Profile,
     
-    [switch]$Silent
+    [switch]$Silent,
+    
+    # Indent complete_profile.json (same as --pretty in extract_profile.py)
+    [switch]$Pretty,
+    
+    # Save the output as a single .zip instead of a folder (same as --zip)
+    [switch]$Zip
 )
 
 [Net.ServicePointManager]::SecurityProtocol = [Net.ServicePointManager]::SecurityProtocol -bor [Net.SecurityProtocolType]::Tls12
@@ -27,6 +33,8 @@ $Script:HypixelBaseUrl = "https://api.hypixel.net/v2"
 $Script:MojangBaseUrl = "https://api.mojang.com"
 $Script:UserAgent = "SkyBlock-Profile-Extractor/2.1"
 $Script:RateLimit = 1200 
+# Hypixel keys are dashed UUIDs (same check as is_valid_api_key in extract_profile.py)
+$Script:ApiKeyPattern = '^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'
 
 $Colors = @{
     Header  = "Cyan"
@@ -229,7 +237,7 @@ function New-OutputDirectory {
 }
 
 function Start-DataExtraction {
-    param([string]$UUID, [object]$ProfileData, [string]$OutputDir)
+    param([string]$UUID, [object]$ProfileData, [string]$OutputDir, [switch]$Pretty)
     
     Write-Header "Extracting Data"
     $extractedFiles = @()
@@ -237,7 +245,7 @@ function Start-DataExtraction {
     # 1. Main Profile Data
     try {
         $profilePath = Join-Path $OutputDir "complete_profile.json"
-        $ProfileData.data | ConvertTo-Json -Depth 100 -Compress:$false | Out-File -FilePath $profilePath -Encoding UTF8
+        $ProfileData.data | ConvertTo-Json -Depth 100 -Compress:(-not $Pretty) | Out-File -FilePath $profilePath -Encoding UTF8
         Write-Success "Saved complete_profile.json"
         $extractedFiles += "complete_profile.json"
     }
@@ -262,7 +270,7 @@ function Start-DataExtraction {
             # Note: Endpoint strings here are appended to the v2 BaseURL
             $data = Invoke-HypixelApiCall -Endpoint $item.Ep -ErrorContext $item.Desc
             $path = Join-Path $OutputDir $item.File
-            $data | ConvertTo-Json -Depth 100 -Compress:$false | Out-File -FilePath $path -Encoding UTF8
+            $data | ConvertTo-Json -Depth 100 -Compress | Out-File -FilePath $path -Encoding UTF8
             Write-Success "Saved $($item.File)"
             $extractedFiles += $item.File
         }
@@ -272,12 +280,17 @@ function Start-DataExtraction {
     return @{ Count = $extractedFiles.Count; Files = $extractedFiles }
 }
 
+function Test-ApiKeyFormat {
+    param([string]$Key)
+    return $Key -match $Script:ApiKeyPattern
+}
+
 function Test-Prerequisites {
     Write-Info "Testing prerequisites..."
     if ($PSVersionTable.PSVersion.Major -lt 3) { return $false }
     
-    if (-not $Script:HypixelApiKey -or $Script:HypixelApiKey.Length -lt 30) {
-        Write-Error-Custom "Invalid Key format."
+    if (-not (Test-ApiKeyFormat $Script:HypixelApiKey)) {
+        Write-Error-Custom "Invalid Key format (expected xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx)."
         return $false
     }
     
@@ -308,7 +321,7 @@ try {
     else {
         Write-Warning "API Key not found in api_key.txt"
         $Script:HypixelApiKey = (Get-UserInput "Enter Hypixel API Key").Trim()
-        if ($Script:HypixelApiKey) { $Script:HypixelApiKey | Out-File $KeyFile -Encoding ASCII }
+        if (Test-ApiKeyFormat $Script:HypixelApiKey) { $Script:HypixelApiKey | Out-File $KeyFile -Encoding ASCII }
     }
 
     if (-not (Test-Prerequisites)) { exit 1 }
@@ -328,7 +341,17 @@ try {
     
     $dir = New-OutputDirectory -Username $player.username -ProfileName $selected.cute_name
     
-    $res = Start-DataExtraction -UUID $player.uuid -ProfileData $selected -OutputDir $dir
+    $res = Start-DataExtraction -UUID $player.uuid -ProfileData $selected -OutputDir $dir -Pretty:$Pretty
+    
+    if ($Zip) {
+        # Compress-Archive needs PowerShell 5+; older versions keep the folder
+        if (Get-Command Compress-Archive -ErrorAction SilentlyContinue) {
+            Compress-Archive -Path $dir -DestinationPath "$dir.zip" -Force
+            Remove-Item $dir -Recurse -Force
+            $dir = "$dir.zip"
+        }
+        else { Write-Warning "-Zip requires PowerShell 5 or later; kept the folder instead" }
+    }
     
     Write-Header "Done! Saved $($res.Count) files to $dir"
     if (-not $Silent) { Read-Host "Press Enter to exit" }
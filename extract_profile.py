@@ -1,11 +1,29 @@
 import requests
 import json
 import os
+import hashlib
+import re
+import shutil
 import time
 import sys
+import threading
+import zipfile
 from datetime import datetime
 from pathlib import Path
+from uuid import UUID
+from operator import itemgetter
 import argparse
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, Future, CancelledError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
 
 # Configuration
 VERSION = "2.0"
@@ -13,6 +31,36 @@ HYPIXEL_API_URL = "https://api.hypixel.net/v2"
 MOJANG_API_URL = "https://api.mojang.com"
 USER_AGENT = f"SkyBlock-Profile-Extractor/{VERSION}"
 TIMEOUT = 30
+CHUNK_SIZE = 64 * 1024
+RATE_LIMIT = 1.0  # Sustained requests/second (Hypixel keys allow 300 per 5 minutes)
+RATE_BURST = 20
+CACHE_DIR = Path.home() / ".cache" / "skyblock_extractor"
+CACHE_TTL = 600  # Default seconds a cached endpoint response stays fresh
+UUID_CACHE_TTL = 7 * 24 * 3600  # Username -> UUID mappings rarely change
+CACHE_GRACE = 24 * 3600  # How long an expired entry may still be revalidated or served if the API fails
+CACHE_MAX_ENTRIES = 500  # Oldest responses beyond this are pruned
+TEMP_FILE_MAX_AGE = 3600  # Leftover .tmp/.prefetch files older than this are from interrupted runs
+QUIET = False  # Suppresses progress output (warnings/errors still print); set by the Streamlit app
+UNSAFE_NAME_CHARS = re.compile(r'[^A-Za-z0-9 _]')
+API_KEY_RE = re.compile(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
+
+# Auxiliary endpoints saved next to the profile: (url, params, filename, description, cache ttl in seconds).
+# Param values are templates filled in with the player's {uuid} and the selected {profile} id.
+# TTLs follow how often each endpoint changes: bazaar prices every few seconds, news and bingo rarely.
+AUX_ENDPOINTS = (
+    (f"{HYPIXEL_API_URL}/player", {'uuid': '{uuid}'}, "player_data.json", "Global Player Stats", 300),
+    (f"{HYPIXEL_API_URL}/skyblock/garden", {'profile': '{profile}'}, "garden_data.json", "Garden Data", 600),
+    (f"{HYPIXEL_API_URL}/skyblock/museum", {'profile': '{profile}'}, "museum_data.json", "Museum Data", 600),
+    (f"{HYPIXEL_API_URL}/guild", {'player': '{uuid}'}, "guild_data.json", "Guild Data", 3600),
+    (f"{HYPIXEL_API_URL}/recentgames", {'uuid': '{uuid}'}, "recent_games.json", "Recent Games", 300),
+    (f"{HYPIXEL_API_URL}/status", {'uuid': '{uuid}'}, "online_status.json", "Online Status", 60),
+    (f"{HYPIXEL_API_URL}/skyblock/firesales", {}, "fire_sales.json", "Fire Sales", 600),
+    (f"{HYPIXEL_API_URL}/skyblock/bingo", {'uuid': '{uuid}'}, "bingo_data.json", "Bingo Data", 3600),
+    (f"{HYPIXEL_API_URL}/skyblock/bazaar", {}, "bazaar_prices.json", "Bazaar Prices", 20),
+    (f"{HYPIXEL_API_URL}/skyblock/auction", {'profile': '{profile}'}, "active_auctions.json", "Active Auctions", 60),
+    (f"{HYPIXEL_API_URL}/skyblock/news", {}, "skyblock_news.json", "SkyBlock News", 3600),
+)
+MAX_WORKERS = len(AUX_ENDPOINTS)  # One worker per endpoint, so the whole plan is in flight at once
 
 # Colors for terminal output
 class Colors:
@@ -24,48 +72,96 @@ class Colors:
     ACCENT = '\033[95m'
     END = '\033[0m'
 
+# Only emit ANSI escapes to a terminal; piped or logged output stays plain
+if not sys.stdout.isatty():
+    for name in ('HEADER', 'SUCCESS', 'WARNING', 'ERROR', 'INFO', 'ACCENT', 'END'):
+        setattr(Colors, name, '')
+
+HEADER_PREFIX = f"\n{Colors.HEADER}>> "
+HEADER_RULE = f"{Colors.HEADER}{'-' * 50}{Colors.END}"
+SUCCESS_PREFIX = f"{Colors.SUCCESS}[✓] "
+INFO_PREFIX = f"{Colors.INFO}[i] "
+WARNING_PREFIX = f"{Colors.WARNING}[!] "
+ERROR_PREFIX = f"{Colors.ERROR}[✗] "
+
 def print_header(title):
-    print(f"\n{Colors.HEADER}>> {title}{Colors.END}")
-    print(f"{Colors.HEADER}{'-' * 50}{Colors.END}")
+    if QUIET: return
+    print(HEADER_PREFIX, title, Colors.END, sep='')
+    print(HEADER_RULE)
 
 def print_success(msg):
-    print(f"{Colors.SUCCESS}[✓] {msg}{Colors.END}")
+    if QUIET: return
+    print(SUCCESS_PREFIX, msg, Colors.END, sep='')
 
 def print_info(msg):
-    print(f"{Colors.INFO}[i] {msg}{Colors.END}")
+    if QUIET: return
+    print(INFO_PREFIX, msg, Colors.END, sep='')
 
 def print_warning(msg):
-    print(f"{Colors.WARNING}[!] {msg}{Colors.END}")
+    print(WARNING_PREFIX, msg, Colors.END, sep='')
 
 def print_error(msg):
-    print(f"{Colors.ERROR}[✗] {msg}{Colors.END}")
+    print(ERROR_PREFIX, msg, Colors.END, sep='')
+
+# --- JSON Helpers ---
+
+def load_json(raw):
+    """Parse a JSON response body with the fastest available library (orjson, ujson, json)."""
+    if orjson:
+        return orjson.loads(raw)
+    if ujson:
+        return ujson.loads(raw)
+    return json.loads(raw)
+
+def dump_json(obj, path, pretty=False):
+    """Write obj to path as UTF-8 JSON in a single write; compact unless pretty is set."""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        path.write_bytes(orjson.dumps(obj, option=option))
+    elif ujson:
+        path.write_text(ujson.dumps(obj, indent=2 if pretty else 0, ensure_ascii=False, escape_forward_slashes=False), encoding='utf-8')
+    elif pretty:
+        path.write_text(json.dumps(obj, indent=2, ensure_ascii=False), encoding='utf-8')
+    else:
+        path.write_text(json.dumps(obj, separators=(',', ':'), ensure_ascii=False), encoding='utf-8')
 
 # --- API Key Handling ---
 
+def is_valid_api_key(key):
+    """Hypixel keys are dashed UUIDs; checked locally so typos fail before any request."""
+    return bool(API_KEY_RE.match(key))
+
 def get_api_key(silent=False):
     """Load API key from file or prompt user."""
     key_file = Path("api_key.txt")
     
+    key = None
     if key_file.exists():
         try:
             key = key_file.read_text().strip()
-            if len(key) > 30:
+            if is_valid_api_key(key):
                 if not silent: print_info("Loaded API key from api_key.txt")
                 return key
         except Exception:
             pass
 
     if silent:
-        print_error("API Key not found in api_key.txt (Required for silent mode)")
+        if key:
+            print_error("API Key in api_key.txt is malformed (expected xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx)")
+        else:
+            print_error("API Key not found in api_key.txt (Required for silent mode)")
         sys.exit(1)
 
-    print_warning("Hypixel API Key not found!")
+    if key:
+        print_warning("API Key in api_key.txt is malformed!")
+    else:
+        print_warning("Hypixel API Key not found!")
     print("  1. Go to https://developer.hypixel.net")
     print("  2. Login and copy your 'Development Key'")
     
     while True:
         key = input(f"\n{Colors.ACCENT}Enter your Hypixel API Key: {Colors.END}").strip()
-        if len(key) > 30:
+        if is_valid_api_key(key):
             try:
                 key_file.write_text(key)
                 print_success("API Key saved to api_key.txt")
@@ -77,45 +173,203 @@ def get_api_key(silent=False):
 
 # --- API Calls ---
 
+class TransientAPIError(Exception):
+    """A failure worth falling back to cached data for: network errors, throttling, server errors."""
+
+TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
+
+class RateLimiter:
+    """Thread-safe token bucket shared by all Hypixel requests."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.resume_at = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Going negative reserves a slot, so concurrent callers queue up behind each other
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0
+            delay = max(delay, self.resume_at - now)
+        if delay > 0:
+            time.sleep(delay)
+
+    def observe(self, headers):
+        """Pause all callers until the window resets once the server says the key's budget is spent."""
+        try:
+            remaining = int(headers['RateLimit-Remaining'])
+            reset = float(headers['RateLimit-Reset'])
+        except (KeyError, ValueError):
+            return
+        if remaining <= 1:
+            self.pause(reset, "API key rate limit reached")
+
+    def pause(self, seconds, reason):
+        """Hold every caller for at least seconds, warning when that pushes the resume time out."""
+        with self.lock:
+            resume_at = time.monotonic() + seconds
+            extended = resume_at > self.resume_at + 1
+            self.resume_at = max(self.resume_at, resume_at)
+        if extended:
+            print_warning(f"{reason}; pausing requests for {seconds:.0f}s")
+
+RATE_LIMITER = RateLimiter(RATE_LIMIT, RATE_BURST)
+
+# One pooled session so Hypixel and Mojang calls reuse keep-alive connections.
+# It lives at module level, so it also survives Streamlit reruns (the module is imported once per server).
+# requests already advertises gzip/deflate (and br when brotli is installed) and decodes transparently.
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': USER_AGENT})
+# Transient failures (throttling, gateway errors) are retried with exponential backoff,
+# honouring Retry-After; the final response is returned so raise_for_hypixel_error can report it.
+RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=TRANSIENT_STATUSES, raise_on_status=False)
+# Hypixel status retries go through get_hypixel instead, so each attempt is counted by RATE_LIMITER.
+CONNECT_RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=(), raise_on_status=False)
+HYPIXEL_RETRIES = 3
+SESSION.mount(HYPIXEL_API_URL, requests.adapters.HTTPAdapter(pool_maxsize=MAX_WORKERS, max_retries=CONNECT_RETRY))
+SESSION.mount(MOJANG_API_URL, requests.adapters.HTTPAdapter(pool_maxsize=1, max_retries=RETRY))
+
 def invoke_mojang_api(endpoint):
     try:
-        resp = requests.get(f"{MOJANG_API_URL}/{endpoint}", timeout=10)
+        resp = SESSION.get(f"{MOJANG_API_URL}/{endpoint}", timeout=10)
         resp.raise_for_status()
-        return resp.json()
+        return load_json(resp.content)
     except Exception as e:
         raise Exception(f"Mojang API Error: {e}")
 
+def raise_for_hypixel_error(resp):
+    """Hypixel reports failures (bad key, throttling, missing data) with a non-200 status."""
+    if resp.status_code == 200:
+        return
+    if resp.status_code == 403:
+        raise Exception("403 Forbidden - Invalid API Key")
+    try:
+        cause = load_json(resp.content).get('cause', 'Unknown error')
+    except ValueError:
+        cause = f"HTTP {resp.status_code}"
+    if resp.status_code in TRANSIENT_STATUSES:
+        raise TransientAPIError(f"API Error: {cause}")
+    raise Exception(f"API Error: {cause}")
+
+def get_hypixel(url, api_key, params, headers=None, **kwargs):
+    """GET from Hypixel through RATE_LIMITER, retrying throttled and server-error responses.
+
+    The key goes in the API-Key header, never the URL, so it can't leak into error messages.
+    Every attempt takes a token; a 429 pauses all callers for its Retry-After. The last response
+    is returned whatever its status.
+    """
+    headers = {**(headers or {}), 'API-Key': api_key}
+    for attempt in range(HYPIXEL_RETRIES + 1):
+        RATE_LIMITER.acquire()
+        resp = SESSION.get(url, params=params, headers=headers, timeout=TIMEOUT, **kwargs)
+        RATE_LIMITER.observe(resp.headers)
+        if resp.status_code not in TRANSIENT_STATUSES or attempt == HYPIXEL_RETRIES:
+            return resp
+        resp.close()
+        try:
+            delay = float(resp.headers['Retry-After'])
+        except (KeyError, ValueError):
+            delay = 0.5 * 2 ** attempt
+        if resp.status_code == 429:
+            RATE_LIMITER.pause(delay, "Throttled by the Hypixel API (429)")
+        else:
+            time.sleep(delay)
+
+def fetch_hypixel_raw(endpoint, api_key, params=None):
+    """Return the undecoded JSON body of a successful Hypixel API call."""
+    try:
+        resp = get_hypixel(f"{HYPIXEL_API_URL}/{endpoint}", api_key, params)
+    except requests.exceptions.RequestException as e:
+        raise TransientAPIError(f"HTTP Error: {e}")
+
+    raise_for_hypixel_error(resp)
+    return resp.content
+
+def download_hypixel(url, api_key, params, path, headers=None):
+    """Stream a successful Hypixel API response to path without holding the body in memory.
+
+    Returns the response headers, or None if a conditional request came back 304 Not Modified.
+    """
+    try:
+        with get_hypixel(url, api_key, params, headers, stream=True) as resp:
+            if resp.status_code == 304:
+                return None
+            raise_for_hypixel_error(resp)
+            with open(path, 'wb') as f:
+                for chunk in resp.iter_content(CHUNK_SIZE):
+                    f.write(chunk)
+            return resp.headers
+    except requests.exceptions.RequestException as e:
+        path.unlink(missing_ok=True)
+        raise TransientAPIError(f"HTTP Error: {e}")
+
 def invoke_hypixel_api(endpoint, api_key, params=None):
-    if params is None: params = {}
-    params['key'] = api_key
+    data = load_json(fetch_hypixel_raw(endpoint, api_key, params))
     
-    headers = {'User-Agent': USER_AGENT}
+    if not data.get('success'):
+        raise Exception(f"API Error: {data.get('cause', 'Unknown error')}")
     
+    return data
+
+# --- Response Cache ---
+
+def cache_path(url, params, prefix=""):
+    """Cache file for an endpoint call. Only the URL and params form the key, never the API key."""
+    key = json.dumps([url, sorted(params.items())])
+    return CACHE_DIR / f"{prefix}{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.json"
+
+def is_fresh(path, ttl):
     try:
-        resp = requests.get(f"{HYPIXEL_API_URL}/{endpoint}", params=params, headers=headers, timeout=TIMEOUT)
-        data = resp.json()
-        
-        if not data.get('success'):
-            raise Exception(f"API Error: {data.get('cause', 'Unknown error')}")
-        
-        return data
-    except requests.exceptions.HTTPError as e:
-        if e.response.status_code == 403:
-            raise Exception("403 Forbidden - Invalid API Key")
-        raise Exception(f"HTTP Error: {e}")
-    except Exception as e:
-        raise Exception(str(e))
+        return time.time() - path.stat().st_mtime < ttl
+    except OSError:
+        return False
+
+def write_cache(path, data):
+    """Atomically replace a cache entry with bytes, or a copy of the file at a Path. CACHE_DIR must exist; see ensure_cache_dir."""
+    try:
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        if isinstance(data, Path):
+            shutil.copyfile(data, tmp)
+        else:
+            tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # Caching is best-effort
+
+def read_cache(path, ttl):
+    """Parsed JSON from a cache entry younger than ttl, or None."""
+    if not is_fresh(path, ttl):
+        return None
+    try:
+        return load_json(path.read_bytes())
+    except (OSError, ValueError):
+        return None
 
 # --- Core Logic ---
 
 def get_player_uuid(username):
     print_info(f"Looking up UUID for '{username}'...")
+    cached = cache_path(f"{MOJANG_API_URL}/users/profiles/minecraft", {'name': username.lower()}, prefix="uuid_")
     try:
-        data = invoke_mojang_api(f"users/profiles/minecraft/{username}")
+        data = read_cache(cached, UUID_CACHE_TTL)
+        if data:
+            print_info("Loaded UUID from cache")
+        else:
+            data = invoke_mojang_api(f"users/profiles/minecraft/{username}")
+            if 'id' in data:
+                ensure_cache_dir()
+                write_cache(cached, json.dumps({'id': data['id'], 'name': data['name']}).encode())
         if 'id' in data:
-            # Format UUID with dashes
+            # Format UUID with dashes; Hypixel keys profile members by the undashed form
             raw_uuid = data['id']
-            formatted_uuid = f"{raw_uuid[:8]}-{raw_uuid[8:12]}-{raw_uuid[12:16]}-{raw_uuid[16:20]}-{raw_uuid[20:]}"
+            formatted_uuid = str(UUID(hex=raw_uuid))
             print_success(f"Found player: {data['name']}")
             return formatted_uuid, raw_uuid
         raise Exception("Player not found")
@@ -130,22 +384,18 @@ def get_profiles(uuid, api_key):
         if not data.get('profiles'):
             raise Exception("No SkyBlock profiles found for this user.")
         
-        profiles = []
-        for p in data['profiles']:
-            # Determine last_save for sorting
-            member = p['members'].get(uuid.replace('-', ''), {})
-            last_save = member.get('last_save', 0)
-            
-            profiles.append({
-                'id': p['profile_id'],
-                'name': p.get('cute_name', 'Unknown'),
-                'game_mode': p.get('game_mode', 'normal'),
-                'last_save': last_save,
-                'data': p
-            })
+        uuid_nodash = uuid.replace('-', '')
+        # last_save (used for sorting) comes from this player's member entry
+        profiles = [{
+            'id': p['profile_id'],
+            'name': p.get('cute_name', 'Unknown'),
+            'game_mode': p.get('game_mode', 'normal'),
+            'last_save': p['members'].get(uuid_nodash, {}).get('last_save', 0),
+            'data': p
+        } for p in data['profiles']]
         
         # Sort by last played (descending)
-        profiles.sort(key=lambda x: x['last_save'], reverse=True)
+        profiles.sort(key=itemgetter('last_save'), reverse=True)
         return profiles
     except Exception as e:
         print_error(f"Profile Fetch Failed: {e}")
@@ -173,53 +423,194 @@ def select_profile(profiles, requested_name=None, silent=False):
         if choice.isdigit() and 1 <= int(choice) <= len(profiles):
             return profiles[int(choice)-1]
 
-def extract_data(uuid, profile, api_key, username):
+def save_endpoint(url, api_key, params, path, ttl=CACHE_TTL, pending=None):
+    """Write an endpoint's body to path, from the disk cache while fresh, otherwise streamed from the API.
+
+    Expired entries are revalidated with If-None-Match/If-Modified-Since. If the API is unreachable,
+    throttling or erroring (TransientAPIError), an entry up to CACHE_GRACE old is served stale instead.
+    Returns how the cache was used ("cached", "not modified", "stale: <cause>"), or None for a
+    fresh download. If pending is a prefetch of the same endpoint (see prefetch_endpoint), its file
+    is moved into place instead of requesting the endpoint twice; only transient failures are retried.
+    """
+    if pending:
+        try:
+            prefetched, source = pending.result()
+            shutil.move(prefetched, path)
+            return source
+        except (TransientAPIError, OSError, CancelledError):
+            pass  # Worth another try: a network hiccup, or the file was pruned meanwhile
+    params = dict(params)
+    cached = cache_path(url, params)
+    if is_fresh(cached, ttl):
+        shutil.copyfile(cached, path)
+        return "cached"
+
+    meta = cached.with_suffix(".meta")
+    validators = read_cache(meta, CACHE_GRACE) if is_fresh(cached, CACHE_GRACE) else None
+    conditional = {}
+    if validators and validators.get('etag'):
+        conditional['If-None-Match'] = validators['etag']
+    if validators and validators.get('last_modified'):
+        conditional['If-Modified-Since'] = validators['last_modified']
+
+    try:
+        headers = download_hypixel(url, api_key, params, path, conditional)
+    except TransientAPIError as e:
+        if not is_fresh(cached, CACHE_GRACE):
+            raise
+        shutil.copyfile(cached, path)
+        return f"stale: {e}"
+
+    if headers is None:
+        # Unchanged on the server, so the cached body and its validators are fresh again
+        for f in (cached, meta):
+            try:
+                os.utime(f)
+            except OSError:
+                pass
+        shutil.copyfile(cached, path)
+        return "not modified"
+
+    write_cache(cached, path)
+    if headers.get('ETag') or headers.get('Last-Modified'):
+        write_cache(meta, json.dumps({'etag': headers.get('ETag'), 'last_modified': headers.get('Last-Modified')}).encode())
+    return None
+
+def prune_cache():
+    """Delete expired entries, temp files left by interrupted runs, and the oldest entries beyond CACHE_MAX_ENTRIES."""
+    now = time.time()
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            files = [(e.name, e.stat().st_mtime) for e in it if e.is_file()]
+    except OSError:
+        return
+
+    doomed, entries = [], []
+    for name, mtime in files:
+        age = now - mtime
+        if name.endswith(('.tmp', '.prefetch')):
+            if age > TEMP_FILE_MAX_AGE: doomed.append(name)
+        elif age > (UUID_CACHE_TTL if name.startswith('uuid_') else CACHE_GRACE):
+            doomed.append(name)
+        elif name.endswith('.json'):
+            entries.append((mtime, name))
+
+    entries.sort(reverse=True)
+    for _, name in entries[CACHE_MAX_ENTRIES:]:
+        doomed += [name, name[:-len('.json')] + '.meta']
+    for name in doomed:
+        try:
+            (CACHE_DIR / name).unlink()
+        except OSError:
+            pass
+
+def ensure_cache_dir():
+    """Create and prune CACHE_DIR. Returns False if it can't be created."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return False  # Extraction still works, just without caching
+    prune_cache()
+    return True
+
+def prefetch_endpoint(url, api_key, params, ttl):
+    """Download an endpoint into a temp file in the cache dir. Returns (path, source) for save_endpoint."""
+    tmp = cache_path(url, params).with_suffix(f".{threading.get_ident()}.prefetch")
+    try:
+        return tmp, save_endpoint(url, api_key, params, tmp, ttl)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+def run_in_background(fn, *args):
+    """Run fn(*args) on a daemon thread and return a Future for its result.
+
+    Unlike an executor's workers, daemon threads are not joined at exit, so Ctrl+C doesn't wait
+    for them; any files they leave behind are removed later by prune_cache.
+    """
+    future = Future()
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+def prefetch_endpoints(uuid, api_key):
+    """Start fetching the auxiliary endpoints that don't depend on the selected profile.
+
+    Returns {url: future} to pass to extract_data, which uses these instead of re-requesting.
+    Nothing is prefetched if the cache dir is unusable, since the download would have nowhere to go.
+    """
+    if not ensure_cache_dir():
+        return {}
+    return {
+        url: run_in_background(prefetch_endpoint, url, api_key, {k: v.format(uuid=uuid) for k, v in params.items()}, ttl)
+        for url, params, _, _, ttl in AUX_ENDPOINTS
+        if '{profile}' not in params.values()
+    }
+
+def extract_data(uuid, profile, api_key, username, pretty=False, prefetched=None):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_dir = Path(f"SkyBlock_{username}_{profile['name']}_{timestamp}")
+    safe_user = UNSAFE_NAME_CHARS.sub('', username).strip()
+    safe_profile = UNSAFE_NAME_CHARS.sub('', profile['name']).strip()
+    output_dir = Path(f"SkyBlock_{safe_user}_{safe_profile}_{timestamp}")
     output_dir.mkdir(parents=True, exist_ok=True)
+    ensure_cache_dir()
+    if prefetched is None: prefetched = {}
     
     print_header("Starting Data Extraction")
     print_info(f"Output Directory: {output_dir}")
 
     extracted_files = []
+    warnings = []
 
-    # 1. Save Complete Profile (The Holy Grail)
-    try:
-        print_info("Saving complete profile data...")
-        with open(output_dir / "complete_profile.json", 'w', encoding='utf-8') as f:
-            json.dump(profile['data'], f, indent=4)
-        print_success("Saved complete_profile.json")
-        extracted_files.append("complete_profile.json")
-    except Exception as e:
-        print_error(f"Failed to save profile: {e}")
-
-    # 2. Auxiliary Data Points
+    # 1. Auxiliary Data Points
     endpoints = [
-        ("player", {'uuid': uuid}, "player_data.json", "Global Player Stats"),
-        ("skyblock/garden", {'profile': profile['id']}, "garden_data.json", "Garden Data"),
-        ("skyblock/museum", {'profile': profile['id']}, "museum_data.json", "Museum Data"),
-        ("guild", {'player': uuid}, "guild_data.json", "Guild Data"),
-        ("recentgames", {'uuid': uuid}, "recent_games.json", "Recent Games"),
-        ("status", {'uuid': uuid}, "online_status.json", "Online Status"),
-        ("skyblock/firesales", {}, "fire_sales.json", "Fire Sales"),
-        ("skyblock/bingo", {'uuid': uuid}, "bingo_data.json", "Bingo Data"),
-        ("skyblock/bazaar", {}, "bazaar_prices.json", "Bazaar Prices"),
-        ("skyblock/auction", {'profile': profile['id']}, "active_auctions.json", "Active Auctions"),
-        ("skyblock/news", {}, "skyblock_news.json", "SkyBlock News")
+        (url, {k: v.format(uuid=uuid, profile=profile['id']) for k, v in params.items()}, filename, desc, ttl)
+        for url, params, filename, desc, ttl in AUX_ENDPOINTS
     ]
 
-    for ep, params, filename, desc in endpoints:
+    # Endpoints are independent, so fetch them concurrently and save in order.
+    # The complete profile is written on the same pool so its encode/write overlaps the downloads.
+    print_info(f"Fetching {len(endpoints)} endpoints...")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS + 1) as executor:
+        profile_future = executor.submit(dump_json, profile['data'], output_dir / "complete_profile.json", pretty)
+        futures = [
+            executor.submit(save_endpoint, url, api_key, params, output_dir / filename, ttl, prefetched.get(url))
+            for url, params, filename, _, ttl in endpoints
+        ]
+
+        # 2. Save Complete Profile (The Holy Grail)
         try:
-            print_info(f"Fetching {desc}...")
-            data = invoke_hypixel_api(ep, api_key, params)
-            with open(output_dir / filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
-            print_success(f"Saved {filename}")
-            extracted_files.append(filename)
+            profile_future.result()
+            print_success("Saved complete_profile.json")
+            extracted_files.append("complete_profile.json")
         except Exception as e:
-            print_warning(f"Skipped {desc}: {e}")
+            print_error(f"Failed to save profile: {e}")
+
+        for future, (_, _, filename, desc, _) in zip(futures, endpoints):
+            try:
+                source = future.result()
+                if source and source.startswith("stale: "):
+                    warnings.append(f"{filename} is from an expired cache entry ({source[len('stale: '):]})")
+                    print_warning(warnings[-1])
+                elif source:
+                    print_success(f"Saved {filename} ({source})")
+                else:
+                    print_success(f"Saved {filename}")
+                extracted_files.append(filename)
+            except Exception as e:
+                warnings.append(f"Skipped {desc}: {e}")
+                print_warning(warnings[-1])
 
     # 3. Generate Report
+    warnings_text = ""
+    if warnings:
+        warnings_text = "\nWARNINGS:\n---------\n" + "\n".join(f"- {w}" for w in warnings) + "\n"
     readme_text = f"""
 SKYBLOCK PROFILE EXTRACTION REPORT
 ===================================
@@ -231,7 +622,7 @@ UUID: {uuid}
 FILES EXTRACTED:
 ----------------
 {chr(10).join(f"- {f}" for f in extracted_files)}
-
+{warnings_text}
 IMPORTANT:
 1. 'complete_profile.json' contains ALL raw data (Inventories, Skills, Collections, etc.).
 2. Data extracted via Official Hypixel API.
@@ -239,13 +630,24 @@ IMPORTANT:
 """
     (output_dir / "README.txt").write_text(readme_text, encoding='utf-8')
     
-    return output_dir, len(extracted_files)
+    return output_dir, len(extracted_files), warnings
+
+def archive_output(output_dir):
+    """Pack the output folder into a single compressed .zip next to it and remove the folder."""
+    archive = Path(f"{output_dir}.zip")
+    with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
+        for f in sorted(output_dir.iterdir()):
+            zf.write(f, f"{output_dir.name}/{f.name}")
+    shutil.rmtree(output_dir)
+    return archive
 
 def main():
     parser = argparse.ArgumentParser(description="Hypixel SkyBlock Profile Extractor v2.0")
     parser.add_argument('username', nargs='?', help="Minecraft Username")
     parser.add_argument('-p', '--profile', help="Specific profile name")
     parser.add_argument('-s', '--silent', action='store_true', help="Run without interaction")
+    parser.add_argument('--pretty', action='store_true', help="Indent complete_profile.json (larger and slower to write)")
+    parser.add_argument('-z', '--zip', action='store_true', help="Save the output as a single .zip instead of a folder")
     args = parser.parse_args()
 
     print_header(f"SkyBlock Extractor v{VERSION}")
@@ -265,20 +667,29 @@ def main():
     uuid_formatted, uuid_raw = get_player_uuid(username)
     profiles = get_profiles(uuid_formatted, api_key)
 
+    # Profile-independent endpoints download while the user is choosing
+    prefetched = prefetch_endpoints(uuid_formatted, api_key)
+
     # 4. Select Profile
     selected = select_profile(profiles, args.profile, args.silent)
 
     # 5. Extract
-    output_dir, count = extract_data(uuid_formatted, selected, api_key, username)
+    output_dir, count, _ = extract_data(uuid_formatted, selected, api_key, username, args.pretty, prefetched)
+    if args.zip:
+        output_dir = archive_output(output_dir)
 
     # 6. Summary
     print_header("Extraction Complete")
     print(f"{Colors.SUCCESS}Successfully extracted {count} files to:{Colors.END}")
     print(f"{Colors.ACCENT}{output_dir}{Colors.END}")
     print(f"\n{Colors.INFO}Next Steps:{Colors.END}")
-    print("1. Zip the folder.")
-    print("2. Upload 'complete_profile.json' and 'bazaar_prices.json' to ChatGPT/Claude.")
-    print("3. Ask: 'Analyze my networth and suggest progression steps.'")
+    if args.zip:
+        print("1. Upload the archive (or 'complete_profile.json' and 'bazaar_prices.json' from it) to ChatGPT/Claude.")
+        print("2. Ask: 'Analyze my networth and suggest progression steps.'")
+    else:
+        print("1. Zip the folder (or rerun with --zip).")
+        print("2. Upload 'complete_profile.json' and 'bazaar_prices.json' to ChatGPT/Claude.")
+        print("3. Ask: 'Analyze my networth and suggest progression steps.'")
 
 if __name__ == "__main__":
     try: